@@ -219,11 +219,10 @@ class Fetcher:
         """
         recipes = []
         count = 0
-        for recipe in self.db.get_recipes():
+        for recipe in self.db.iter_recipes():
             if formatted := h2r.recipe2out(recipe, self.counts, md=self.markdown):
                 count += 1
-                for line in formatted:
-                    recipes.append(line)
+                recipes += formatted
 
         if count > 3:
             titles_raw = self.db.get_titles()
@@ -246,12 +245,16 @@ class Fetcher:
         """
         Writes the recipe to :py:attr`output`.
 
+        The lines are handed to the file one by one instead of being joined into one
+        string first, so the formatted output never exists twice in memory.
+
         Args:
             lines: The lines to be written
         """
         logger.info("--- Writing to output ---")
         if lines:
             logger.info("Writing to %s", self.output)
-            self.output.write_text("".join(lines))
+            with self.output.open("w") as file:
+                file.writelines(lines)
         else:
             logger.warning("Nothing to write")
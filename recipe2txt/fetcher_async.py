@@ -19,17 +19,28 @@ connections.
 
 The subclass resides in a separate module so that :py:class:`fetcher.Fetcher` can be
 imported even if none of the async-
-libraries are installed.
+libraries are installed. Importing this module only checks whether 'aiohttp' is
+available, the package itself is loaded once the first fetch starts (falling back to
+the synchronous fetching of :py:class:`fetcher.Fetcher` if it cannot be imported).
 """
 import asyncio
-from typing import Literal
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Final, Literal
 
-import aiohttp
+if find_spec("aiohttp") is None:
+    raise ImportError("No module named 'aiohttp'", name="aiohttp")
+
+if TYPE_CHECKING:
+    import aiohttp
 
 from recipe2txt.fetcher import Fetcher, logger
 from recipe2txt.utils.ContextLogger import QueueContextManager as QCM
 from recipe2txt.utils.misc import NEVER_CATCH, URL
 
+_READ_BUFSIZE: Final = 2**20
+"""Large enough to receive most recipe-pages in one piece (aiohttp defaults to
+64 KiB)"""
+
 
 class AsyncFetcher(Fetcher):
     """
@@ -42,50 +53,63 @@ class AsyncFetcher(Fetcher):
     def fetch_urls(self, urls: set[URL]) -> None:
         """Fetches the missing URLs from the web and writes the results to the
         database."""
+        try:
+            import aiohttp  # Checks if the installed package can actually be loaded
+        except ImportError as e:
+            logger.error(
+                "Could not import aiohttp, fetching synchronously instead: ",
+                exc_info=e,
+            )
+            super().fetch_urls(urls)
+            return
         asyncio.run(self._fetch(urls))
 
     async def _fetch(self, urls: set[URL]) -> None:
-        q: asyncio.queues.Queue[URL] = asyncio.Queue()
-        for url in urls:
-            await q.put(url)
+        import aiohttp
+        from aiohttp import TooManyRedirects
+
         timeout = aiohttp.ClientTimeout(
-            total=10 * len(urls) * self.timeout,
+            total=10 * self.timeout,
             connect=self.timeout,
             sock_connect=None,
             sock_read=None,
         )
-        tasks = [
-            asyncio.create_task(self._fetch_task(q, timeout))
-            for i in range(self.connections)
-        ]
-        await asyncio.gather(*tasks)
+        semaphore = asyncio.Semaphore(self.connections)
+        async with aiohttp.ClientSession(
+            timeout=timeout,
+            headers={"User-Agent": self.user_agent},
+            connector=aiohttp.TCPConnector(limit=self.connections),
+            read_bufsize=_READ_BUFSIZE,
+        ) as session:
+            await asyncio.gather(*(
+                self._fetch_task(session, semaphore, url, TooManyRedirects)
+                for url in urls
+            ))
 
     async def _fetch_task(
         self,
-        url_queue: asyncio.queues.Queue[URL],
-        timeout: aiohttp.client.ClientTimeout,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        url: URL,
+        too_many_redirects: type[Exception],
     ) -> None:
-        async with aiohttp.ClientSession(
-            timeout=timeout, headers={"User-Agent": self.user_agent}
-        ) as session:
-            while not url_queue.empty():
-                url = await url_queue.get()
-                with QCM(logger, logger.info, "Fetching %s", url, defer_emit=True):
-                    html = None
-                    try:
-                        async with session.get(url) as response:
-                            html = await response.text()
-                        self.counts.reached += 1
-                    except (
-                        aiohttp.client_exceptions.TooManyRedirects,
-                        asyncio.TimeoutError,
-                    ) as e:
-                        logger.error("Unable to reach website: ", exc_info=e)
-                    except NEVER_CATCH:
-                        raise
-                    except Exception as e:
-                        logger.error("Error while connecting to website: ", exc_info=e)
-                    if html:
-                        self.html2db(url, html)
-                    else:
-                        self.db.insert_recipe_unreachable(url)
+        async with semaphore:
+            with QCM(logger, logger.info, "Fetching %s", url, defer_emit=True):
+                html = None
+                try:
+                    async with session.get(url) as response:
+                        html = await response.text()
+                    self.counts.reached += 1
+                except (
+                    too_many_redirects,
+                    asyncio.TimeoutError,
+                ) as e:
+                    logger.error("Unable to reach website: ", exc_info=e)
+                except NEVER_CATCH:
+                    raise
+                except Exception as e:
+                    logger.error("Error while connecting to website: ", exc_info=e)
+                if html:
+                    self.html2db(url, html)
+                else:
+                    self.db.insert_recipe_unreachable(url)
@@ -23,8 +23,6 @@ Attributes:
     Parsed (NewType): Data :py:mod:`recipe_scrapers` extracted from the HTML-file
     NA (LiteralString): Sentinel indicating that the data for this attribute is not
         available
-    SCRAPER_VERSION (str): Contains the version of :py:mod:`recipe_scrapers`
-    currently loaded
     UNINIT_RECIPE (Recipe): A :py:class:`Recipe` containing only default values for
         attributes
     Recipe-Attribute-Lists: These lists contain the names of :py:class:`Recipe` as
@@ -41,17 +39,9 @@ Attributes:
 """
 import re
 from enum import IntEnum
+from functools import cache
 from os import linesep
-from typing import Any, Final, NamedTuple, NewType
-
-import recipe_scrapers
-from importlib_metadata import version
-from recipe_scrapers._exceptions import (
-    ElementNotFoundInHtml,
-    NoSchemaFoundInWildMode,
-    SchemaOrgException,
-    WebsiteNotImplementedError,
-)
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, NewType
 
 from recipe2txt.parsing_error import handle_parsing_error
 from recipe2txt.utils.conditional_imports import LiteralString
@@ -68,16 +58,33 @@ from recipe2txt.utils.markdown import (
 )
 from recipe2txt.utils.misc import NEVER_CATCH, URL, Counts, dict2str, is_url
 
+if TYPE_CHECKING:
+    from recipe_scrapers._abstract import AbstractScraper
+
 logger = get_logger(__name__)
 """The logger for the module. Receives the constructed logger from 
 :py:mod:`recipe2txt.utils.ContextLogger`"""
 
-Parsed = NewType("Parsed", recipe_scrapers._abstract.AbstractScraper)
+Parsed = NewType("Parsed", "AbstractScraper")
 """Data :py:mod:`recipe_scrapers` extracted from the HTML-file"""
 NA: Final = "N/A"
 """Sentinel indicating that the data for this attribute is not available"""
-SCRAPER_VERSION: Final = version("recipe_scrapers")
-"""Contains the version of :py:mod:`recipe_scrapers` currently loaded"""
+
+
+@cache
+def get_scraper_version() -> str:
+    """
+    Get the version of :py:mod:`recipe_scrapers`.
+
+    The lookup walks the metadata of the installed packages, so it is deferred until
+    the version is actually needed and only done once.
+
+    Returns:
+        The version of :py:mod:`recipe_scrapers` currently installed
+    """
+    from importlib_metadata import version
+
+    return version("recipe_scrapers")
 
 
 class RecipeStatus(IntEnum):
@@ -164,13 +171,11 @@ def none2na(t: tuple[Any, ...]) -> tuple[Any, ...]:
             f"Expected a Recipe-based tuple (length {len(t)},"
             f" but got something longer (length {len(RECIPE_ATTRIBUTES)})"
         )
-    if None in t:
-        tmp = list(t)
-        t = tuple([
-            tmp[i] if tmp[i] else getattr(UNINIT_RECIPE, RECIPE_ATTRIBUTES[i])
-            for i in range(len(tmp))
-        ])
-    return t
+    if None not in t:
+        return t
+    return tuple(
+        value if value else default for value, default in zip(t, UNINIT_RECIPE)
+    )
 
 
 ESSENTIAL: Final[list[LiteralString]] = ["ingredients", "instructions"]
@@ -196,6 +201,13 @@ RECIPE_ATTRIBUTES: Final[list[LiteralString]] = METHODS + [
 ]
 """names of all attributes in a :py:class:`Recipes`"""
 
+_ESSENTIAL_END: Final = len(ESSENTIAL)
+_ON_DISPLAY_END: Final = len(ON_DISPLAY)
+_METHODS_END: Final = len(METHODS)
+
+_METHOD_NAMES: Final = {method: method.replace("_", " ") for method in METHODS}
+"""Maps every entry of :py:data:`METHODS` to its human-readable name"""
+
 
 def int2status(t: tuple[Any, ...]) -> tuple[Any, ...]:
     """
@@ -254,6 +266,10 @@ def get_url(parsed: Parsed) -> URL:
 
 
 _contains_alphanumeric = re.compile(r"\w")
+_LINESEP: Final = f"(?:{re.escape(linesep)})"
+_REDUNDANT_LINEBREAKS: Final = re.compile(f"{_LINESEP}{{1,2}},|{_LINESEP}{{2}}")
+"""Matches pairs of line breaks and line breaks followed by a stray comma (both are
+replaced by a single line break)"""
 
 
 def info2str(method: str, info: Any) -> str:
@@ -278,7 +294,7 @@ def info2str(method: str, info: Any) -> str:
     """
     log = logger.error if method in ON_DISPLAY else logger.warning
     unexpected_type = True
-    method_name = method.replace("_", " ")
+    method_name = _METHOD_NAMES.get(method) or method.replace("_", " ")
 
     if info is NA:
         return NA
@@ -308,8 +324,7 @@ def info2str(method: str, info: Any) -> str:
                 unexpected_type = False
         elif method == "instructions":
             if isinstance(info, str):
-                info = info.replace(linesep * 2, linesep)
-                info = info.replace("\n,", "\n")
+                info = _REDUNDANT_LINEBREAKS.sub(linesep, info)
                 unexpected_type = False
             elif isinstance(info, list):
                 info = linesep.join(info)
@@ -334,8 +349,10 @@ def get_info(method: str, parsed: Parsed) -> Any:
     Returns:
         The extracted information or :py:data`NA` should the extraction fail.
     """
+    from recipe_scrapers._exceptions import ElementNotFoundInHtml, SchemaOrgException
+
     log = logger.error if method in ON_DISPLAY else logger.warning
-    method_name = method.replace("_", " ")
+    method_name = _METHOD_NAMES.get(method) or method.replace("_", " ")
 
     info = NA
     try:
@@ -374,20 +391,17 @@ def gen_status(infos: list[str]) -> RecipeStatus:
     Returns:
         A recipe-status that matches the values in infos
     """
-    if len(infos) > len(METHODS):
+    if len(infos) > _METHODS_END:
         raise ValueError(
             "This function only analyzes attributes contained in html2recipe.methods."
             + f" Expected {len(METHODS)} elements, got {len(infos)}"
         )
-    for i in range(len(ESSENTIAL)):
-        if infos[i] == NA:
-            return RecipeStatus.INCOMPLETE_ESSENTIAL
-    for i in range(len(ESSENTIAL), len(ON_DISPLAY)):
-        if infos[i] == NA:
-            return RecipeStatus.INCOMPLETE_ON_DISPLAY
-    for i in range(len(ON_DISPLAY), len(METHODS)):
-        if infos[i] == NA:
-            return RecipeStatus.COMPLETE_ON_DISPLAY
+    if NA in infos[:_ESSENTIAL_END]:
+        return RecipeStatus.INCOMPLETE_ESSENTIAL
+    if NA in infos[_ESSENTIAL_END:_ON_DISPLAY_END]:
+        return RecipeStatus.INCOMPLETE_ON_DISPLAY
+    if NA in infos[_ON_DISPLAY_END:_METHODS_END]:
+        return RecipeStatus.COMPLETE_ON_DISPLAY
     return RecipeStatus.COMPLETE
 
 
@@ -412,7 +426,7 @@ def parsed2recipe(parsed: Parsed) -> Recipe:
     recipe = Recipe(
         url=get_url(parsed),
         status=status,
-        scraper_version=SCRAPER_VERSION,
+        scraper_version=get_scraper_version(),
         ingredients=infos[0],
         instructions=infos[1],
         title=infos[2],
@@ -437,36 +451,42 @@ def _re2md(recipe: Recipe) -> list[str]:
     escaped = [esc(step) for step in recipe.instructions.split(linesep)]
     instructions = ordered(*escaped)
 
-    md = (
-        [
-            header(title, 2, True),
-            paragraph(),
-            recipe.total_time + " min | " + recipe.yields,
-            paragraph(),
-        ]
-        + ingredients
-        + [EMPTY_COMMENT]
-        + instructions
-        + [paragraph(), italic("from:"), " ", link(url, host), paragraph()]
-    )
+    md = [
+        header(title, 2, True),
+        paragraph(),
+        recipe.total_time + " min | " + recipe.yields,
+        paragraph(),
+        *ingredients,
+        EMPTY_COMMENT,
+        *instructions,
+        paragraph(),
+        italic("from:"),
+        " ",
+        link(url, host),
+        paragraph(),
+    ]
 
     return md
 
 
+_TXT_TEMPLATE: Final = (linesep * 2).join(
+    ["%s", "%s min | %s", "%s", "%s", "from: %s"]
+) + (linesep * 5)
+"""Layout of a recipe in the txt-format (title, total time, yields, ingredients, 
+instructions, url)"""
+
+
 def _re2txt(recipe: Recipe) -> list[str]:
     title = recipe.title if recipe.title != NA else recipe.url
-    txt = [
+    txt = _TXT_TEMPLATE % (
         title,
-        linesep * 2,
-        recipe.total_time + " min | " + recipe.yields + linesep * 2,
+        recipe.total_time,
+        recipe.yields,
         recipe.ingredients,
-        linesep * 2,
         recipe.instructions.replace(linesep, linesep * 2),
-        linesep * 2,
-        "from: " + recipe.url,
-        linesep * 5,
-    ]
-    return txt
+        recipe.url,
+    )
+    return [txt]
 
 
 def recipe2out(
@@ -505,7 +525,8 @@ def html2parsed(url: URL, html: str) -> Parsed | None:
     """
     Parses the HTML of the recipe-website.
 
-    Uses :py:mod:`recipe_scrapers to handle the parsing.
+    Uses :py:mod:`recipe_scrapers to handle the parsing. The library is only imported
+    on the first call, since importing it is expensive.
 
     Args:
         url: The URL the HTML was extracted from
@@ -515,6 +536,12 @@ def html2parsed(url: URL, html: str) -> Parsed | None:
         The parsed data if the recipe could be extracted or 'None' if there was a
         failure
     """
+    import recipe_scrapers
+    from recipe_scrapers._exceptions import (
+        NoSchemaFoundInWildMode,
+        WebsiteNotImplementedError,
+    )
+
     try:
         parsed: Parsed = Parsed(recipe_scrapers.scrape_html(html=html, org_url=url))
     except (WebsiteNotImplementedError, NoSchemaFoundInWildMode):
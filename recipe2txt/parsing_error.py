@@ -22,9 +22,10 @@ import os
 import textwrap
 import traceback
 import urllib
-from importlib.metadata import version
+from collections import defaultdict
+from functools import lru_cache
 from os import linesep
-from typing import Callable, Final, NamedTuple
+from typing import Any, Callable, Final, Iterator, NamedTuple
 
 from recipe2txt.file_setup import HOW_TO_REPORT_NAME, get_parsing_error_dir
 from recipe2txt.utils.ContextLogger import get_logger
@@ -36,9 +37,6 @@ logger = get_logger(__name__)
 """The logger for the module. Receives the constructed logger from 
 :py:mod:`recipe2txt.utils.ContextLogger`"""
 
-SCRAPER_VERSION: Final = version("recipe_scrapers")
-"""Contains the version of :py:mod:`recipe_scrapers` currently loaded"""
-
 
 class ParsingError(NamedTuple):
     """Consists of a TracebackException and the URL of the recipe where the parsing
@@ -48,6 +46,12 @@ class ParsingError(NamedTuple):
     traceback: traceback.TracebackException
 
 
+@lru_cache(maxsize=8192)
+def _host_of(url: URL) -> str | None:
+    """Extracts the host from the URL (cached, since errors often share hosts)."""
+    return urllib.parse.urlsplit(url).hostname
+
+
 def handle_parsing_error(
     url: URL,
     exception: Exception,
@@ -80,32 +84,84 @@ def handle_parsing_error(
     if not save_error:
         return None
 
-    parsing_error = ParsingError(
-        url=url, traceback=traceback.TracebackException.from_exception(exception)
+    # Reading the source lines for every frame is deferred until the traceback is
+    # formatted, keeping this path cheap for errors that are never reported.
+    tb_ex = traceback.TracebackException.from_exception(
+        exception, lookup_lines=False, capture_locals=False
     )
+    parsing_error = ParsingError(url=url, traceback=tb_ex)
     method = method if method else "general parsing error"
-    host = urllib.parse.urlparse(url).hostname
+    host = _host_of(url)
     if not host:
         logger.warning("Could not extract host from %s ", url)
         host = url
-    if host in categorized_errors:
-        if method in categorized_errors[host]:
-            if exception_name in categorized_errors[host][method]:
-                categorized_errors[host][method][exception_name].append(parsing_error)
-            else:
-                categorized_errors[host][method][exception_name] = [parsing_error]
-        else:
-            categorized_errors[host][method] = {exception_name: [parsing_error]}
-    else:
-        categorized_errors[host] = {method: {exception_name: [parsing_error]}}
+    categorized_errors[(host, method, exception_name)].append(parsing_error)
 
     return parsing_error
 
 
-def errors2str() -> list[tuple[str, str]]:
+def _trace_signature(tb_ex: traceback.TracebackException) -> tuple[Any, ...]:
+    frames = tuple((frame.filename, frame.lineno, frame.name) for frame in tb_ex.stack)
+    return frames, tuple(tb_ex.format_exception_only())
+
+
+def _report_chunks(
+    host: str, method: str, exception_name: str, parsing_errors: list[ParsingError]
+) -> Iterator[str]:
+    from recipe2txt.html2recipe import get_scraper_version
+
+    yield PRE_CHECK_MSG
+
+    urls = [parsing_error.url for parsing_error in parsing_errors]
+    triggered_by = (
+        "scrape_html()" if method == "general parsing error" else f".{method}()"
+    )
+    yield from unordered(
+        "host: " + code(host),
+        "recipe-scrapers version: " + code(get_scraper_version()),
+        "exception: " + code(exception_name),
+        "triggered by calling: " + code(triggered_by),
+        "triggered on: ",
+    )
+    yield from unordered(*urls, level=1)
+    yield linesep
+
+    # Errors raised by the same code path produce identical traces, which only need
+    # to be formatted (and shown) once.
+    urls_by_trace: dict[tuple[Any, ...], list[URL]] = {}
+    unique_traces: list[traceback.TracebackException] = []
+    for error in parsing_errors:
+        signature = _trace_signature(error.traceback)
+        if signature not in urls_by_trace:
+            urls_by_trace[signature] = []
+            unique_traces.append(error.traceback)
+        urls_by_trace[signature].append(error.url)
+
+    shared_frames = get_shared_frames(unique_traces)
+    formatted_stacks = format_stacks(unique_traces, shared_frames, "recipe2txt")
+
+    yield f"{bold('Stack Traces')}{linesep * 2}"
+    if len(unique_traces) > 1:
+        yield (
+            italic(
+                "'...' indicates frames present in all traces"
+                "(but only shown in the first)"
+            )
+            + linesep * 2
+        )
+
+    for trace_urls, stack in zip(urls_by_trace.values(), formatted_stacks):
+        for url in trace_urls:
+            yield f"URL: {url}{linesep}"
+        yield linesep
+        yield from codeblock(*stack, language="python")
+        yield linesep * 2
+
+
+def iter_error_reports() -> Iterator[tuple[str, Iterator[str]]]:
     """
-    Generates a textual representation for every :py:class`ParsingError`stored in
-    :py:data:`categorized_errors`
+    Lazily generates a textual representation for every :py:class`ParsingError`
+    stored in :py:data:`categorized_errors`
 
     These markdown-formatted representations are intended to be copy&pasted into the
     text-field of a Github-issue, thus
@@ -113,7 +169,7 @@ def errors2str() -> list[tuple[str, str]]:
     error¹ () all occurrences are grouped
     into the same text. One stack-trace is shown fully, all other traces will have
     all shared² frames except one
-    removed.
+    removed. Identical traces are only shown once, below all URLs that triggered them.
 
     1: It is considered the same error, if the host of the recipe-url,
     the :py:data:`METHOD` that caused the error and
@@ -121,87 +177,48 @@ def errors2str() -> list[tuple[str, str]]:
 
     2: Frames that are exactly the same for all stack traces
 
+    Returns:
+        An iterator over tuples. Each tuple contains the title for the issue and an
+        iterator over the chunks of the textual representation. The chunks are only
+        generated when consumed, so that they can be written out one by one.
+    """
+    for category, parsing_error_list in categorized_errors.items():
+        host, method, exception_name = category
+        host = host[4:] if host.startswith("www.") else host
+        title = (
+            f"{host.split('.')[0]}: {method} - {exception_name} (found by recipe2txt)"
+        )
+        yield title, _report_chunks(host, method, exception_name, parsing_error_list)
+
+
+def errors2str() -> list[tuple[str, str]]:
+    """
+    Generates a textual representation for every :py:class`ParsingError`stored in
+    :py:data:`categorized_errors`
+
+    See :py:func:`iter_error_reports`.
+
     Returns:
         A list of tuples. Each tuple contains the title for the issue and the textual
         representation
     """
-    reports = []
-    for host, methoddict in categorized_errors.items():
-        for method, exception_names in methoddict.items():
-            for exception_name, parsing_error_list in exception_names.items():
-                msg = PRE_CHECK_MSG
-
-                host = host[4:] if host.startswith("www.") else host
-                title = (
-                    f"{host.split('.')[0]}: {method} - {exception_name} (found by"
-                    " recipe2txt)"
-                )
-
-                urls = [parsing_error.url for parsing_error in parsing_error_list]
-                triggered_by = (
-                    "scrape_html()"
-                    if method == "general parsing error"
-                    else f".{method}()"
-                )
-                infos = unordered(
-                    "host: " + code(host),
-                    "recipe-scrapers version: " + code(SCRAPER_VERSION),
-                    "exception: " + code(exception_name),
-                    "triggered by calling: " + code(triggered_by),
-                    "triggered on: ",
-                ) + unordered(*urls, level=1)
-
-                tb_ex_list = [error.traceback for error in parsing_error_list]
-                shared_frames = get_shared_frames(tb_ex_list)
-                formatted_stacks = format_stacks(
-                    tb_ex_list, shared_frames, "recipe2txt"
-                )
-
-                if len(urls) > 1:
-                    dot_explanation = (
-                        italic(
-                            "'...' indicates frames present in all traces"
-                            "(but only shown in the first)"
-                        )
-                        + linesep * 2
-                    )
-                else:
-                    dot_explanation = ""
-
-                stack_traces = [f"{bold('Stack Traces')}{linesep * 2}", dot_explanation]
-
-                for error, stack in zip(parsing_error_list, formatted_stacks):
-                    stack_traces.append(f"URL: {error.url}{linesep * 2}")
-                    stack_traces += codeblock(*stack, language="python")
-                    stack_traces.append(linesep * 2)
-
-                msg += "".join(infos) + linesep + "".join(stack_traces)
-                reports.append((title, msg))
-
-    return reports
-
-
-categorized_errors: dict[str, dict[str, dict[str, list[ParsingError]]]] = dict()
+    return [(title, "".join(chunks)) for title, chunks in iter_error_reports()]
+
+
+categorized_errors: defaultdict[tuple[str, str, str], list[ParsingError]] = defaultdict(
+    list
+)
 """
 A dictionary for categorizing :py:class:`ParsingErrors` based on metadata.
 
-The variable contains three levels of dictionary-nesting. The outer dictionary maps 
-the hosts of URLs to further dictionaries. 
-Those further dictionaries map a method-name (see :py:data:`METHODS`) to more 
-dictionaries. Those dictionaries map
-the name of the exception from :py:attr:`ParsingError.traceback` to lists containing 
-parsing errors.
-Overview:
-    outer dictionary (host of url -> middle dictionaries)
-    middle dictionary (method where the traceback occurred -> inner dictionaries)
-    inner dictionary(name of the exception that caused the traceback -> list of 
-    parsing errors)
-
+Each key is a tuple consisting of the host of the URL, the method-name (see 
+:py:data:`METHODS`) where the traceback occurred and the name of the exception from 
+:py:attr:`ParsingError.traceback`. Each key maps to a list containing all parsing 
+errors sharing this metadata.
 
 The categorized errors will be used to generate markdown-formatted files, that can be 
 submitted as Github-Issues.
-This nested-dictionary-abomination is used to group similar errors together, so that 
-the can all be reported in one
+Grouping similar errors under the same key allows them to all be reported in one
 issue.
 """
 
@@ -221,8 +238,8 @@ PRE_CHECK_MSG: Final = textwrap.dedent("""
 
 def write_errors(debug: bool = False) -> int:
     """
-    Writes the error reports from :py:func:`recipe2txt.html2recipe.errors2str` to a
-    timestamped directory.
+    Writes the error reports from :py:func:`iter_error_reports` to a timestamped
+    directory.
 
     Args:
         debug: Whether the reports should be written into the normal- or into the
@@ -232,7 +249,7 @@ def write_errors(debug: bool = False) -> int:
         Number of errors written
 
     """
-    if not (errors := errors2str()):
+    if not categorized_errors:
         return 0
 
     logger.info("---Writing error reports---")
@@ -241,9 +258,10 @@ def write_errors(debug: bool = False) -> int:
         return 0
     how_to_report_file = error_dir.parent / HOW_TO_REPORT_NAME
 
-    for title, msg in errors:
+    for title, chunks in iter_error_reports():
         filename = (error_dir / title).with_suffix(".md")
-        filename.write_text(msg)
+        with filename.open("w") as file:
+            file.writelines(chunks)
 
     warn_msg = (
         "During its execution the program encountered recipes "
@@ -252,4 +270,4 @@ def write_errors(debug: bool = False) -> int:
     )
     logger.warning(warn_msg, how_to_report_file)
 
-    return len(errors)
+    return len(categorized_errors)
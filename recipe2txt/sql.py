@@ -29,16 +29,25 @@ Attributes:
 import logging
 import sqlite3
 import textwrap
-from typing import Any, Final, Tuple
+from typing import Any, Callable, Final, Iterator, Tuple
 
 from recipe2txt.utils.conditional_imports import LiteralString
-from recipe2txt.utils.ContextLogger import get_logger
-
-from .html2recipe import METHODS, NA, RECIPE_ATTRIBUTES, SCRAPER_VERSION, Recipe
+from recipe2txt.utils.ContextLogger import get_logger, shown_on_stream
+
+from .html2recipe import (
+    ESSENTIAL,
+    METHODS,
+    NA,
+    ON_DISPLAY,
+    RECIPE_ATTRIBUTES,
+    Recipe,
+)
 from .html2recipe import RecipeStatus as RS
-from .html2recipe import gen_status, int2status, none2na
+from .html2recipe import get_scraper_version, none2na
 from .utils.misc import URL, AccessibleDatabase, File, head_str, obj2sql_str
 
+__all__ = ["RECIPE_ROW_ATTRIBUTES", "fetch_again", "Database"]
+
 logger = get_logger(__name__)
 """The logger for the module. Receives the constructed logger from 
 :py:mod:`recipe2txt.utils.ContextLogger`"""
@@ -77,65 +86,162 @@ _CREATE_TABLES: Final = textwrap.dedent("""
             UNIQUE(fileID, recipeID) ON CONFLICT IGNORE
         ) STRICT;
     """)
+_ENABLE_WAL: Final = "PRAGMA journal_mode=WAL"
+"""Returns the journal-mode in effect afterwards, which stays the old one if WAL is
+not available (e.g. for in-memory databases)"""
+
+_PRAGMAS: Final = textwrap.dedent("""
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        PRAGMA mmap_size=268435456;
+    """)
+"""The database is only a cache, so losing the last transaction on power loss is
+acceptable in exchange for cheaper commits (no fsync per commit in WAL-mode)."""
+
+_BUSY_TIMEOUT: Final = 30.0
+"""Seconds to wait for a lock held by another connection (e.g. a second instance of
+the program writing to the same cache) before giving up"""
+
 RECIPE_ROW_ATTRIBUTES: Final[list[LiteralString]] = RECIPE_ATTRIBUTES + [
     "recipeID",
     "last_fetched",
 ]
 """Contains the names of all rows in the table 'recipes'."""
 
+_RECIPE_COLUMNS: Final = obj2sql_str(*RECIPE_ATTRIBUTES)
+_RECIPE_PLACEHOLDERS: Final = ",".join("?" * len(RECIPE_ATTRIBUTES))
+
 _INSERT_RECIPE: Final = (
-    "INSERT OR IGNORE INTO recipes"
-    + " ("
-    + obj2sql_str(*RECIPE_ATTRIBUTES)
-    + ")"
-    + " VALUES ("
-    + ("?," * len(RECIPE_ATTRIBUTES))[:-1]
-    + ")"
+    f"INSERT OR IGNORE INTO recipes ({_RECIPE_COLUMNS}) VALUES ({_RECIPE_PLACEHOLDERS})"
 )
 
 _INSERT_OR_REPLACE_RECIPE: Final = (
-    "INSERT OR REPLACE INTO recipes"
-    + " ("
-    + obj2sql_str(*RECIPE_ATTRIBUTES)
-    + ")"
-    + " VALUES ("
-    + ("?," * len(RECIPE_ATTRIBUTES))[:-1]
-    + ")"
+    f"INSERT OR REPLACE INTO recipes ({_RECIPE_COLUMNS}) VALUES"
+    f" ({_RECIPE_PLACEHOLDERS})"
 )
 
+
+def _is_na(column: str) -> str:
+    return f"({column} IS NULL OR {column} IN ('', '{NA}'))"
+
+
+def _is_unreachable(column: str) -> str:
+    return f"({column} = {RS.UNREACHABLE:d})"
+
+
+def _take_new(column: str, is_na: Callable[[str], str] = _is_na) -> str:
+    """SQL-condition that is true if :py:meth:`Database.insert_recipe` would choose
+    the new value for column over the old one."""
+    return (
+        f"(NOT {is_na('excluded.' + column)} AND (:prefer_new OR"
+        f" {is_na('recipes.' + column)}))"
+    )
+
+
+_MERGED_METHODS: Final = {
+    method: (
+        f"CASE WHEN {_take_new(method)} THEN excluded.{method} ELSE"
+        f" recipes.{method} END"
+    )
+    for method in METHODS
+}
+
+
+def _na_in(columns: list[LiteralString]) -> str:
+    return " OR ".join(f"({_MERGED_METHODS[column]}) = '{NA}'" for column in columns)
+
+
+_MERGED_STATUS: Final = (
+    f"CASE WHEN recipes.status > {RS.UNKNOWN:d} AND excluded.status < {RS.UNKNOWN:d}"
+    f" THEN (CASE WHEN {_na_in(ESSENTIAL)} THEN {RS.INCOMPLETE_ESSENTIAL:d}"
+    f" WHEN {_na_in(ON_DISPLAY)} THEN {RS.INCOMPLETE_ON_DISPLAY:d}"
+    f" WHEN {_na_in(METHODS)} THEN {RS.COMPLETE_ON_DISPLAY:d}"
+    f" ELSE {RS.COMPLETE:d} END)"
+    " ELSE max(recipes.status, excluded.status) END"
+)
+
+_ANY_UPDATED: Final = " OR ".join(
+    [_take_new(method) for method in METHODS]
+    + [
+        _take_new("url"),
+        _take_new("status", _is_unreachable),
+        _take_new("scraper_version"),
+    ]
+)
+
+_UPSERT_RECIPE: Final = (
+    f"INSERT INTO recipes ({_RECIPE_COLUMNS}) VALUES"
+    f" ({', '.join(':' + attribute for attribute in RECIPE_ATTRIBUTES)})"
+    " ON CONFLICT (url) DO UPDATE SET "
+    + ", ".join(
+        f"{obj2sql_str(method)} = {merged}"
+        for method, merged in _MERGED_METHODS.items()
+    )
+    + f", status = {_MERGED_STATUS}, scraper_version = :current_version"
+    + f" WHERE {_ANY_UPDATED}"
+    + f" RETURNING {_RECIPE_COLUMNS}"
+)
+"""Inserts a recipe or merges it with the existing entry that has the same url. The
+merge is done the same way as in :py:meth:`Database.insert_recipe`. Uses named
+parameters: every attribute of the recipe, 'prefer_new' and 'current_version'.
+Returns the merged entry, or nothing if the existing entry was left untouched."""
+
 _INSERT_FILE: Final = "INSERT OR IGNORE INTO files ( filepath ) VALUES ( ? )"
+_GET_FILE_ID: Final = "SELECT fileID FROM files WHERE filepath = ?"
 
 _ASSOCIATE_FILE_RECIPE: Final = (
     "INSERT OR IGNORE INTO contents (fileID, recipeID) VALUES ("
-    " (SELECT fileID FROM files WHERE filepath = ?),"
+    " ?,"
     " (SELECT recipeID FROM recipes WHERE url = ?))"
 )
 
-_FILEPATHS_JOIN_RECIPES: Final = (
-    " ((SELECT * FROM files WHERE filepath = ?) "
-    " NATURAL JOIN contents NATURAL JOIN recipes) "
+_CONTENTS_JOIN_RECIPES: Final = (
+    " contents JOIN recipes USING (recipeID) WHERE fileID = ?"
 )
 _GET_RECIPE: Final = (
-    "SELECT "  # nosec B608
-    + obj2sql_str(*RECIPE_ATTRIBUTES)
-    + " FROM recipes WHERE url = ?"
+    f"SELECT {_RECIPE_COLUMNS} FROM recipes WHERE url = ?"  # nosec B608
 )
 _GET_RECIPES: Final = (
-    "SELECT "  # nosec B608
-    + obj2sql_str(*RECIPE_ATTRIBUTES)
-    + " FROM"
-    + _FILEPATHS_JOIN_RECIPES
-    + "WHERE status >= "
-    + obj2sql_str(RS.INCOMPLETE_ON_DISPLAY)
+    f"SELECT {_RECIPE_COLUMNS} FROM{_CONTENTS_JOIN_RECIPES}"  # nosec B608
+    f" AND status >= {obj2sql_str(RS.INCOMPLETE_ON_DISPLAY)}"
+)
+_CREATE_WANTED: Final = "CREATE TEMP TABLE IF NOT EXISTS wanted(url TEXT PRIMARY KEY)"
+_CLEAR_WANTED: Final = "DELETE FROM wanted"
+_INSERT_WANTED: Final = "INSERT OR IGNORE INTO wanted (url) VALUES (?)"
+_ALWAYS_FETCH_AGAIN: Final = (RS.UNREACHABLE, RS.NOT_INITIALIZED)
+"""Statuses of recipes that are scraped again on every request"""
+_FETCH_AGAIN_IF_OUTDATED: Final = (
+    RS.INCOMPLETE_ESSENTIAL,
+    RS.UNKNOWN,
+    RS.INCOMPLETE_ON_DISPLAY,
+    RS.COMPLETE_ON_DISPLAY,
 )
-_GET_URLS_STATUS_VERSION: Final = "SELECT url, status, scraper_version FROM recipes"
-_GET_CONTENT: Final = "SELECT url FROM" + _FILEPATHS_JOIN_RECIPES
+"""Statuses of recipes that are scraped again once a newer scraper-version is used"""
+
+# CROSS JOIN makes SQLite loop over the (small) wanted-table and look up each url in
+# the index of recipes instead of scanning recipes
+_CACHED_WANTED: Final = (
+    " FROM wanted CROSS JOIN recipes USING (url)"
+    f" WHERE status NOT IN ({', '.join(f'{s:d}' for s in _ALWAYS_FETCH_AGAIN)})"
+    " AND (status NOT IN"
+    f" ({', '.join(f'{s:d}' for s in _FETCH_AGAIN_IF_OUTDATED)})"
+    " OR scraper_version >= ?)"
+)
+"""All wanted recipes, for which :py:func:`fetch_again` returns 'False' (takes the
+current scraper-version as parameter)"""
+_ASSOCIATE_FILE_CACHED_WANTED: Final = (
+    "INSERT OR IGNORE INTO contents (fileID, recipeID) SELECT ?, recipeID"
+    + _CACHED_WANTED
+)
+_GET_CACHED_URLS_STATUS_VERSION: Final = (
+    "SELECT url, status, scraper_version" + _CACHED_WANTED
+)
+_GET_CONTENT: Final = f"SELECT url FROM{_CONTENTS_JOIN_RECIPES}"
 
 _GET_TITLES_HOSTS: Final = (
-    "SELECT title, host FROM"  # nosec B608
-    + _FILEPATHS_JOIN_RECIPES
-    + " WHERE status >= "
-    + obj2sql_str(RS.INCOMPLETE_ON_DISPLAY)
+    f"SELECT title, host FROM{_CONTENTS_JOIN_RECIPES}"  # nosec B608
+    f" AND status >= {obj2sql_str(RS.INCOMPLETE_ON_DISPLAY)}"
 )
 
 _DROP_ALL: Final = (
@@ -167,24 +273,32 @@ def fetch_again(status: RS, scraper_version: str) -> bool:
     Returns:
         Whether the recipe should be scraped again.
     """
-    if status in (RS.UNREACHABLE, RS.NOT_INITIALIZED):
+    if status in _ALWAYS_FETCH_AGAIN:
         return True
 
-    if (
-        status
-        in (
-            RS.INCOMPLETE_ESSENTIAL,
-            RS.UNKNOWN,
-            RS.INCOMPLETE_ON_DISPLAY,
-            RS.COMPLETE_ON_DISPLAY,
-        )
-        and scraper_version < SCRAPER_VERSION
-    ):
+    if status in _FETCH_AGAIN_IF_OUTDATED and scraper_version < get_scraper_version():
         return True
 
     return False
 
 
+_STATUS_OF_INT: Final = {int(status): status for status in RS}
+
+
+def _row2recipe(row: tuple[Any, ...]) -> Recipe:
+    """Converts a row of the recipes-table to a :py:class:`html2recipe.Recipe`.
+
+    Equivalent to ``Recipe(*int2status(none2na(row)))``, but with a single
+    dictionary lookup for the status instead of the checks done by
+    :py:func:`html2recipe.int2status`.
+    """
+    if None in row:
+        row = none2na(row)
+    return Recipe._make(
+        row[:-2] + (_STATUS_OF_INT.get(row[-2], RS.NOT_INITIALIZED), row[-1])
+    )
+
+
 class Database:
     """
     The interface between the program and the cache (i.e. the Sqlite3-database).
@@ -205,12 +319,16 @@ class Database:
     the
     :py:attr:`html2recipe.Recipe.url`.
 
+    The database is operated in WAL-mode if possible, so SQLite keeps the files
+    '<database>-wal' and '<database>-shm' next to the database while it is in use.
+
     Attributes:
         con: The connection to the database
         cur: The cursor used by this class
         filepath: The path to the recipe-file. All recipes touched during the
         lifetime of this class will be associated
             with this file.
+        file_id: The ID of :py:attr:`filepath` in the database
     """
 
     def __init__(self, database: AccessibleDatabase, output_file: File) -> None:
@@ -224,11 +342,21 @@ class Database:
             database: The database to be used as cache
             output_file: The path to the file that the recipes will be written to
         """
-        self.con = sqlite3.connect(database)
+        self.con = sqlite3.connect(database, timeout=_BUSY_TIMEOUT)
         self.cur = self.con.cursor()
+        journal_mode = self.cur.execute(_ENABLE_WAL).fetchone()[0]
+        if journal_mode != "wal":
+            logger.warning(
+                "Could not enable WAL-mode for %s, using journal-mode '%s' instead",
+                database,
+                journal_mode,
+            )
+        self.cur.executescript(_PRAGMAS)
         self.cur.executescript(_CREATE_TABLES)
         self.filepath = str(output_file)
         self.cur.execute(_INSERT_FILE, (self.filepath,))
+        self.cur.execute(_GET_FILE_ID, (self.filepath,))
+        self.file_id: int = self.cur.fetchone()[0]
         self.con.commit()
 
     def new_recipe(self, recipe: Recipe) -> Recipe:
@@ -242,16 +370,16 @@ class Database:
         :py:meth:`Database.replace_recipe`, if recipe should replace the recipe-entry
         in the cache completely.
         """
-        self.cur.execute(_INSERT_RECIPE, tuple(recipe))
-        self.cur.execute(_ASSOCIATE_FILE_RECIPE, (self.filepath, recipe.url))
+        self.cur.execute(_INSERT_RECIPE, recipe)
+        self.cur.execute(_ASSOCIATE_FILE_RECIPE, (self.file_id, recipe.url))
         self.con.commit()
         return recipe
 
     def replace_recipe(self, recipe: Recipe) -> Recipe:
         """Inserts a new recipe into the database or replaces an existing recipe (if
         the urls are the same)."""
-        self.cur.execute(_INSERT_OR_REPLACE_RECIPE, tuple(recipe))
-        self.cur.execute(_ASSOCIATE_FILE_RECIPE, (self.filepath, recipe.url))
+        self.cur.execute(_INSERT_OR_REPLACE_RECIPE, recipe)
+        self.cur.execute(_ASSOCIATE_FILE_RECIPE, (self.file_id, recipe.url))
         self.con.commit()
         return recipe
 
@@ -265,30 +393,36 @@ class Database:
     def get_recipe(self, url: URL) -> Recipe:
         """Retrieves the entry that matches url from the recipe-table and returns a
         :py:class:`html2recipe.Recipe`."""
-        if row := self.get_recipe_row(url):
-            row = none2na(row)
-            row = int2status(row)
-        r = Recipe(*row)  # type: ignore[misc]
-        return r
+        return _row2recipe(self.get_recipe_row(url))  # type: ignore[arg-type]
 
     def get_recipes(self) -> list[Recipe]:
         """Retrieves all recipes associated with :py:attr:`Database.filepath`"""
-        self.cur.execute(_GET_RECIPES, (self.filepath,))
-        recipes = [Recipe(*int2status(none2na(row))) for row in self.cur.fetchall()]
-        return recipes
+        rows = self.cur.execute(_GET_RECIPES, (self.file_id,))
+        return [_row2recipe(row) for row in rows]
+
+    def iter_recipes(self) -> Iterator[Recipe]:
+        """
+        Yields all recipes associated with :py:attr:`Database.filepath` one by one.
+
+        Works like :py:meth:`Database.get_recipes`, but without holding all recipes in
+        memory at once. Uses its own cursor, so other methods can be called while
+        iterating.
+        """
+        for row in self.con.execute(_GET_RECIPES, (self.file_id,)):
+            yield _row2recipe(row)
 
     def get_titles(self) -> list[tuple[str, str]]:
         """Retrieves all titles and host-names from recipes associated with
         :py:attr:`Database.filepath`"""
-        rows = self.cur.execute(_GET_TITLES_HOSTS, (self.filepath,))
+        rows = self.cur.execute(_GET_TITLES_HOSTS, (self.file_id,))
         return rows.fetchall()
 
     def urls_to_fetch(self, wanted: set[URL]) -> set[URL]:
         """
         Filters for recipes that need to be scraped from the web.
 
-        If the URL is already in the cache, :py:func:`fetch_again` decides whether
-        the recipe should be scraped again.
+        If the URL is already in the cache, the rule of :py:func:`fetch_again`
+        (evaluated in SQL) decides whether the recipe should be scraped again.
 
         Args:
             wanted: URLs of the recipes that are wanted
@@ -296,10 +430,17 @@ class Database:
         Returns:
             URLs of the recipes that should be fetched (again).
         """
-        self.cur.execute(_GET_URLS_STATUS_VERSION)
-        available = self.cur.fetchall()
-        for url, status, version in available:
-            if url in wanted and not fetch_again(status, version):
+        self.cur.execute(_CREATE_WANTED)
+        self.cur.execute(_CLEAR_WANTED)
+        self.cur.executemany(_INSERT_WANTED, [(url,) for url in wanted])
+        self.cur.execute(
+            _ASSOCIATE_FILE_CACHED_WANTED, (self.file_id, get_scraper_version())
+        )
+        self.con.commit()
+        self.cur.execute(_GET_CACHED_URLS_STATUS_VERSION, (get_scraper_version(),))
+        cached = self.cur.fetchall()
+        if shown_on_stream(logging.INFO):
+            for url, status, version in cached:
                 if status == RS.UNKNOWN:
                     logger.info(
                         "Not refetching %s, scraper-version (%s) since last fetch has"
@@ -309,24 +450,22 @@ class Database:
                     )
                 else:
                     logger.info("Using cached version of %s", url)
-
-                wanted.remove(url)
-                self.cur.execute(_ASSOCIATE_FILE_RECIPE, (self.filepath, url))
-                if not wanted:
-                    break
-        self.con.commit()
+        for url, _, _ in cached:
+            wanted.remove(url)
         return wanted
 
     def insert_recipe_unreachable(self, url: URL) -> Recipe:
         """Mark the recipe associated with url as 'unreachable' (if url is unknown to
         the cache)."""
-        r = Recipe(url=url, status=RS.UNREACHABLE, scraper_version=SCRAPER_VERSION)
+        r = Recipe(
+            url=url, status=RS.UNREACHABLE, scraper_version=get_scraper_version()
+        )
         return self.insert_recipe(r)
 
     def insert_recipe_unknown(self, url: URL) -> Recipe:
         """Mark the recipe associated with url as 'unknown' (if url is unknown to the
         cache)."""
-        r = Recipe(url=url, status=RS.UNKNOWN, scraper_version=SCRAPER_VERSION)
+        r = Recipe(url=url, status=RS.UNKNOWN, scraper_version=get_scraper_version())
         return self.insert_recipe(r)
 
     def insert_recipe(self, recipe: Recipe, prefer_new: bool = False) -> Recipe:
@@ -353,63 +492,44 @@ class Database:
         Returns:
             An updated recipe.
         """
-        old_row = self.get_recipe_row(recipe.url)
-        new_row = tuple(recipe)
-        merged_row = []
-        updated = []
-
-        if not old_row:
-            self.new_recipe(recipe)
-            return recipe
-
-        for old_val, new_val in zip(old_row, new_row):
-            if (new_val and new_val != NA) and (
-                prefer_new or not (old_val and old_val != NA)
-            ):
-                merged_row.append(new_val)
-                updated.append(True)
-            else:
-                merged_row.append(old_val)
-                updated.append(False)
-
-        merged_row[-1] = SCRAPER_VERSION
-
-        if True in updated:
-            if (
-                not old_row[-2] <= RS.UNKNOWN
-                and new_row[-2] < RS.UNKNOWN  # type: ignore[operator]
-            ):
-                merged_row[-2] = gen_status(
-                    merged_row[: len(METHODS)]  # type: ignore[arg-type]
-                )
-            else:
-                merged_row[-2] = max(old_row[-2], new_row[-2])
-            r = Recipe(*merged_row)  # type: ignore[arg-type]
-            if logger.isEnabledFor(logging.INFO):
-                for attr, old_val, new_val, is_replaced in zip(
-                    RECIPE_ATTRIBUTES, old_row, new_row, updated
-                ):
-                    if is_replaced:
+        # The previous values are only needed to show what changed
+        old_row = (
+            self.get_recipe_row(recipe.url) if shown_on_stream(logging.INFO) else None
+        )
+        old = _row2recipe(old_row) if old_row else None
+        self.cur.execute(_UPSERT_RECIPE, self._upsert_params(recipe, prefer_new))
+        row = self.cur.fetchone()
+        self.cur.execute(_ASSOCIATE_FILE_RECIPE, (self.file_id, recipe.url))
+        self.con.commit()
+        if row:
+            r = _row2recipe(row)
+            if old:
+                for attr, old_val, new_val in zip(RECIPE_ATTRIBUTES, old, r):
+                    if old_val != new_val:
                         logger.info(
-                            "%s: %s => %s",
-                            attr,
-                            head_str(old_val),
-                            head_str(new_val),
+                            "%s: %s => %s", attr, head_str(old_val), head_str(new_val)
                         )
-            self.replace_recipe(r)
         else:
-            r = Recipe(*merged_row)  # type: ignore[arg-type]
+            # The entry was left untouched and kept its version, the merge is current
+            r = old if old else self.get_recipe(recipe.url)
+            r = r._replace(scraper_version=get_scraper_version())
         return r
 
+    @staticmethod
+    def _upsert_params(recipe: Recipe, prefer_new: bool) -> dict[str, Any]:
+        params = recipe._asdict()
+        params["prefer_new"] = prefer_new
+        params["current_version"] = get_scraper_version()
+        return params
+
     def get_contents(self) -> list[URL]:
         """Get all URLs associated with this :py:attr:`filepath`."""
-        self.cur.execute(_GET_CONTENT, (self.filepath,))
-        urls = [URL(url[0]) for url in self.cur.fetchall()]
-        return urls
+        rows = self.cur.execute(_GET_CONTENT, (self.file_id,))
+        return [url for (url,) in rows]
 
     def set_contents(self, urls: set[URL]) -> None:
         """Associates all URLs in urls with :py:attr:`filepath`."""
-        file_url = [(self.filepath, url) for url in urls]
+        file_url = [(self.file_id, url) for url in urls]
         self.cur.executemany(_ASSOCIATE_FILE_RECIPE, file_url)
         self.con.commit()
 
@@ -422,7 +542,10 @@ class Database:
         """
         Closes the cursor and the database connection.
 
-        Using this class after a call to this method will result in errors.
+        Using this class after a call to this method will result in errors. Before
+        closing, SQLite is given the chance to update the statistics used by its
+        query planner.
         """
+        self.cur.execute("PRAGMA optimize")
         self.cur.close()
         self.con.close()
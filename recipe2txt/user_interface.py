@@ -64,6 +64,9 @@ logger = get_logger(__name__)
 
 
 class FileListingArgParse(argparse.ArgumentParser):
+    config_is_empty: bool = False
+    """Whether the config-file the defaults were read from is empty"""
+
     def format_help(self) -> str:
         help_msg = super().format_help()
         files = get_files()
@@ -93,7 +96,7 @@ WHICH_VALUE_SET_MSG: Final = (
 )
 
 
-def config_args(config_file: Path) -> argparse.ArgumentParser:
+def config_args(config_file: Path) -> FileListingArgParse:
     """
     Creates a parser for this program.
 
@@ -115,6 +118,7 @@ def config_args(config_file: Path) -> argparse.ArgumentParser:
     )
 
     arg_config = ArgConfig(parser, config_file)
+    parser.config_is_empty = arg_config.is_empty
 
     arg_config.add_narg("url", "URLs whose recipes should be added to the recipe-file")
     arg_config.add_narg(
@@ -179,12 +183,13 @@ def config_args(config_file: Path) -> argparse.ArgumentParser:
         "Erases all data- and cache-files (e.g. the files listed below)",
         short=None,
     )
+    arg_config.finalize()
 
     return parser
 
 
 @cache
-def get_parser() -> argparse.ArgumentParser:
+def get_parser() -> FileListingArgParse:
     return config_args(CONFIG_FILE)
 
 
@@ -244,7 +249,7 @@ def sancheck_args(a: argparse.Namespace, output: File) -> None:
                 ext,
             )
 
-    if CONFIG_FILE.stat().st_size == 0:
+    if get_parser().config_is_empty:
         logger.warning("The config-file %s is empty", CONFIG_FILE)
 
 
@@ -27,13 +27,14 @@ The config-file-format used is TOML (https://toml.io)
 """
 import argparse
 import os
+import re
 import sys
 import textwrap
 from enum import unique
 from pathlib import Path
 from typing import Any, Final, Generic, Iterable, Literal, TypeVar
 
-from recipe2txt.utils.conditional_imports import StrEnum, tomllib
+from recipe2txt.utils.conditional_imports import StrEnum
 from recipe2txt.utils.misc import File, ensure_accessible_file_critical
 
 
@@ -75,17 +76,15 @@ def obj2toml(o: Any) -> str:
         A string that can be used as a value to a TOML-key
     """
     if isinstance(o, list):
-        s = ""
-        for e in o:
-            s += f"{obj2toml_i(e)}, "
-        s = s[:-2]
-        return f"[{s}]"
+        return "[" + ", ".join(obj2toml_i(e) for e in o) + "]"
     if isinstance(o, dict):
-        s = ""
-        for key, value in o.items():
-            s += f"{obj2toml_i(key)}: {obj2toml_i(value)}, "
-        s = s[:-2]
-        return "{" + s + "}"
+        return (
+            "{"
+            + ", ".join(
+                f"{obj2toml_i(key)}: {obj2toml_i(value)}" for key, value in o.items()
+            )
+            + "}"
+        )
     return obj2toml_i(o)
 
 
@@ -240,6 +239,8 @@ class ChoiceOption(BasicOption, Generic[T]):
         choices: Iterable[T],
         short: str | None = "",
     ):
+        # Iterated more than once (and possibly by argparse), so it cannot be lazy
+        choices = list(choices)
         if default not in choices:
             raise ValueError(f"Parameter {default=} not in {choices=}")
         super().__init__(option_name, help_str, default, short)
@@ -348,6 +349,9 @@ class NArgOption(BasicOption):
         return isinstance(value, list)
 
 
+_SETS_A_VALUE: Final = re.compile(rb"^[ \t]*[^#\s]", re.MULTILINE)
+"""Matches the first line of a TOML-file that is neither blank nor a comment"""
+
 CFG_PREAMBLE: Final = textwrap.dedent("""
     #*****************************************************************************
     # Configuration file for the program %s
@@ -375,9 +379,8 @@ Help text explaining how the config-file works.
 
 Should be written to the beginning of every config file.
 
-Takes three %-formatting-args: first and third are pretty-print-borders, the second 
-is the name of the program the
-config-file belongs to.
+Takes one %-formatting-arg: the name of the program the config-file belongs to (the
+pretty-print-borders are part of the text).
 """
 
 
@@ -389,19 +392,38 @@ class ArgConfig:
     every option that is added tries to
     retrieve a default-value from it, otherwise the option will fall back onto the
     given default. If no config-file is
-    available, a new one will be created and every option will write a
-    TOML-key-value-pair-representation of itself
-    to the file while being added.
+    available, a new one will be created and every option will contribute a
+    TOML-key-value-pair-representation of itself, which is written to the file in
+    one go by :py:meth:`finalize`.
     """
 
     def __init__(self, parser: argparse.ArgumentParser, config_file: Path):
         self.parser = parser
-        self.existed_before = config_file.is_file()
-        self.file = ensure_accessible_file_critical(config_file)
-        if self.existed_before:
-            with self.file.open("rb") as cfg:
+        # Reading right away answers whether the file exists without a separate stat
+        data: bytes | None
+        try:
+            data = config_file.read_bytes()
+        except OSError:
+            data = None
+        self.existed_before = data is not None
+        # An existing config-file is only read, so it does not need to be writable
+        self.file = (
+            File(config_file)
+            if self.existed_before
+            else ensure_accessible_file_critical(config_file)
+        )
+        self._pending_toml: list[str] = []
+        self.is_empty = False
+        """Whether the config-file existed before, but did not contain anything"""
+        if data is not None:
+            self.is_empty = not data
+            self.toml: dict[str, Any] = {}
+            # The generated file has every option commented out
+            if _SETS_A_VALUE.search(data):
+                from recipe2txt.utils.conditional_imports import tomllib
+
                 try:
-                    self.toml = tomllib.load(cfg)
+                    self.toml = tomllib.loads(data.decode())
                 except tomllib.TOMLDecodeError as e:
                     msg = (
                         f"The config-file ({config_file}) seems to be misconfigured"
@@ -412,7 +434,7 @@ class ArgConfig:
                     print(msg, file=sys.stderr)
                     sys.exit(os.EX_DATAERR)
         else:
-            self.file.write_text(CFG_PREAMBLE % (80 * "*", parser.prog, 80 * "*"))
+            self._pending_toml.append(CFG_PREAMBLE % parser.prog)
 
     def error_exit(self) -> None:
         if not self.existed_before:
@@ -421,13 +443,21 @@ class ArgConfig:
             except FileNotFoundError:
                 pass
 
+    def finalize(self) -> None:
+        """Writes the preamble and the TOML-representations of all options added so
+        far to the newly created config-file."""
+        if self._pending_toml:
+            with self.file.open("a") as f:
+                f.writelines(self._pending_toml)
+            self._pending_toml.clear()
+
     def _add_option(self, option: type, args: tuple[Any, ...]) -> None:
         try:
             o = option(*args)
-            if self.existed_before:
+            if not self.existed_before:
+                self._pending_toml.append(o.to_toml_str())
+            elif self.toml:
                 o.from_toml(self.toml)
-            else:
-                o.to_toml(self.file)
             o.add_to_parser(self.parser)
         except (argparse.ArgumentError, ValueError) as e:
             print(f"{args=}")
@@ -340,6 +340,21 @@ def get_stream_handler(
     return stream_handler
 
 
+def shown_on_stream(level: int) -> bool:
+    """Whether records of this level reach the command line, i.e. whether the
+    verbosity configured via :py:func:`root_log_setup` includes them.
+
+    Module loggers are always set to DEBUG (see :py:func:`get_logger`), so
+    :py:meth:`logging.Logger.isEnabledFor` cannot be used to skip work that only
+    serves optional log-messages.
+    """
+    return any(
+        isinstance(f, QueueContextFilter) and f.log_level <= level
+        for handler in logging.getLogger().handlers
+        for f in handler.filters
+    )
+
+
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
@@ -17,6 +17,7 @@
 isort:skip_file
 """
 from sys import version_info
+from typing import TYPE_CHECKING, Any
 
 if version_info >= (3, 11):
     from typing import LiteralString as LiteralString
@@ -28,9 +29,24 @@ if version_info >= (3, 11):
 else:
     from backports.strenum import StrEnum  # type: ignore[import-not-found, no-redef]
 
-if version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib  # type: ignore[import-not-found, no-redef]
+if TYPE_CHECKING:
+    if version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib  # type: ignore[import-not-found, no-redef]
+
+
+def __getattr__(name: str) -> Any:
+    # The TOML-parser is only needed if there is a config-file to read, so it is
+    # imported on first access
+    if name == "tomllib":
+        global tomllib
+        if version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib  # type: ignore[no-redef]
+        return tomllib
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["LiteralString", "StrEnum", "tomllib"]
@@ -17,6 +17,7 @@ import os
 import os.path
 import re
 import sqlite3
+import stat
 import sys
 import urllib.parse
 from os import linesep
@@ -61,7 +62,12 @@ URL = NewType("URL", str)
 
 
 def is_url(value: str) -> TypeGuard[URL]:
-    return bool(validators.url(value))
+    # Without 'simple_host' (validators >= 0.21) only hosts with a dot (domains,
+    # IPv4) or bracketed IPv6-addresses are accepted, so most non-URLs can be
+    # rejected without calling validators (bare hosts like 'localhost' are invalid)
+    return ("." in value or "[" in value) and bool(
+        validators.url(value, simple_host=False)
+    )
 
 
 def extract_urls(lines: list[str]) -> set[URL]:
@@ -80,7 +86,8 @@ def extract_urls(lines: list[str]) -> set[URL]:
                 reconstructed = urllib.parse.urlunparse(
                     (parsed.scheme, parsed.netloc, parsed.path, "", "", "")
                 )
-                url = reconstructed if is_url(reconstructed) else url
+                if reconstructed != url and is_url(reconstructed):
+                    url = reconstructed
 
                 if url in processed:
                     logger.warning("%s already queued", url)
@@ -211,21 +218,21 @@ def _ensure_accessible_file(
     path: Path,
 ) -> tuple[File | None, tuple[str, Any] | tuple[str, Any, Any]]:
     try:
-        if path.is_dir():
-            return None, (
-                (
-                    "%s is already a directory, thus a file with the same name cannot"
-                    " exist"
-                ),
-                path,
-            )
-        exists = path.is_file()
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        mode = 0
     except OSError as e:
         return None, (
             "File cannot be accessed: %s (%s)",
             path,
             getattr(e, "message", repr(e)),
         )
+    if stat.S_ISDIR(mode):
+        return None, (
+            "%s is already a directory, thus a file with the same name cannot exist",
+            path,
+        )
+    exists = stat.S_ISREG(mode)
     if not exists:
         directory, msg = _ensure_existence_dir(path.parent)
         if directory:
@@ -240,10 +247,9 @@ def _ensure_accessible_file(
                 )
         else:
             return None, msg
-    with path.open("r") as f:
+    with path.open("a+") as f:
         if not f.readable():
             return None, ("File cannot be read: %s", path)
-    with path.open("a") as f:
         if not f.writable():
             return None, ("File is not writable: %s", path)
     return File(path), (DO_NOT_LOG, "", "")
@@ -296,9 +302,7 @@ def read_files(*possible_paths: str | Path) -> list[str]:
         path = full_path(p)
         if path.is_file():
             logger.info("Reading %s", path)
-            path.read_text()
-            with path.open("r") as file:
-                lines += list(file.readlines())
+            lines += path.read_text().splitlines(keepends=True)
         else:
             logger.error("Not a file: %s", path)
     return lines
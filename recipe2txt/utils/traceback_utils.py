@@ -17,6 +17,7 @@
 import os
 import traceback
 from copy import deepcopy
+from itertools import islice
 from os import linesep
 
 
@@ -32,6 +33,7 @@ def shorten_paths(
 
     start = 1 if skip_first else 0
     for frame in stack[start:]:
+        _ = frame.line  # Load the source line (if deferred) before altering the path
         tmp = frame.filename.split(first_visible_dir, 1)
         if len(tmp) == 1:
             remaining_path = os.path.split(tmp[0])[1]  # Just the filename
@@ -80,9 +82,15 @@ def format_stacks(
             tb_ex.stack = shorten_paths(tb_ex.stack, first_visible_dir)
     if first_visible_dir:
         shared_stack = shorten_paths(shared_stack, first_visible_dir)
-    first_stack = shared_stack.format() + list(tb_exes_copy[0].format())[1:]
+    # Extend the lists in place, skipping the 'Traceback (most recent call last):'
+    # header without materializing and slicing an intermediate list per stack.
+    stacks = [shared_stack.format()]
+    stacks[0] += islice(tb_exes_copy[0].format(), 1, None)
 
     sep = ["\t..." + linesep] if shared_stack else []
-    stacks = [sep + list(tb_ex.format())[1:] for tb_ex in tb_exes_copy[1:]]
+    for tb_ex in tb_exes_copy[1:]:
+        stack = sep.copy()
+        stack += islice(tb_ex.format(), 1, None)
+        stacks.append(stack)
 
-    return [first_stack] + stacks
+    return stacks
@@ -251,6 +251,16 @@ class TestChoiceOption(TestInitOption):
                         self.assertTrue(c.toml_valid(choice))
                 self.assertFalse(c.toml_valid("WRONG VALUE THAT DOES NOT MAKE SENSE"))
 
+    def test_choices_iterator(self):
+        for idx, (init_params, _) in enumerate(co_params):
+            with self.subTest(i=idx, parameter=init_params):
+                choices = init_params["choices"]
+                c = argconfig.ChoiceOption(**init_params | {"choices": iter(choices)})
+                self.assertValidInit(c, init_params)
+                for choice in choices:
+                    with self.subTest(choice):
+                        self.assertTrue(c.toml_valid(choice))
+
 
 t_valid_string_1 = textwrap.dedent("""
     
@@ -547,3 +557,19 @@ class TestArgConfig(unittest.TestCase):
                 for key in d_valid.keys():
                     with self.subTest(key=key):
                         self.assertEqual(d_parsed.get(key), d_valid.get(key))
+
+    def test_app_argconfig_empty(self):
+        f = ensure_accessible_file(DEBUG_DIRS.config, CONFIG_NAME)
+        f.write_text("")
+        self.assertTrue(config_args(f).config_is_empty)
+        f.write_text(app_params[0][1])
+        self.assertFalse(config_args(f).config_is_empty)
+
+    def test_app_argconfig_new(self):
+        f = DEBUG_DIRS.config / CONFIG_NAME
+        p = config_args(f)
+        self.assertTrue(f.is_file())
+        text = f.read_text()
+        self.assertIn(p.prog, text)
+        self.assertEqual(vars(p.parse_args([])), standard_params)
+        self.assertEqual(vars(config_args(f).parse_args([])), standard_params)
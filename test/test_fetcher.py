@@ -15,13 +15,17 @@
 # recipe2txt. If not, see <https://www.gnu.org/licenses/>.
 
 import random
+import sys
 import test.testfiles.permanent.testfile_generator as file_gen
 import unittest
+from importlib.util import find_spec
 from test.test_helpers import TEST_PROJECT_TMPDIR, create_tmpdirs, delete_tmpdirs
 from test.test_sql import db_path, out_name_md, out_name_txt, out_path_md, out_path_txt
+from unittest import mock
 
-from recipe2txt.fetcher import Cache
-from recipe2txt.utils.misc import ensure_accessible_file, is_accessible_db
+from recipe2txt.fetcher import Cache, Fetcher
+from recipe2txt.utils.ContextLogger import suppress_logging
+from recipe2txt.utils.misc import URL, ensure_accessible_file, is_accessible_db
 
 
 class Test(unittest.TestCase):
@@ -86,3 +90,18 @@ class Test(unittest.TestCase):
             for line, validation in zip(file, file_gen.FULL_MD):
                 with self.subTest(line=line, validation=validation):
                     self.assertEqual(line, validation)
+
+    @unittest.skipIf(find_spec("aiohttp") is None, "aiohttp is not installed")
+    def test_async_fallback(self):
+        from recipe2txt.fetcher_async import AsyncFetcher
+
+        af = AsyncFetcher(output=out_path_txt, database=db_path)
+        urls = {URL("https://www.example.com/recipe")}
+        # 'None' in sys.modules makes the import fail like a broken installation
+        with (
+            mock.patch.dict(sys.modules, {"aiohttp": None}),
+            mock.patch.object(Fetcher, "fetch_urls") as sync_fetch,
+            suppress_logging(),
+        ):
+            af.fetch_urls(urls)
+        sync_fetch.assert_called_once_with(urls)
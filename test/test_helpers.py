@@ -76,14 +76,14 @@ test_recipes: list[h2r.Recipe] = [
     h2r.Recipe(
         url=misc.URL("https://www.websitedown.com/recipe1"),
         status=h2r.RecipeStatus.UNREACHABLE,
-        scraper_version=h2r.SCRAPER_VERSION,
+        scraper_version=h2r.get_scraper_version(),
     ),
     h2r.Recipe(
         title="Meal",
         host="incomplete_essential.com",
         url=misc.URL("https://www.incomplete.essential.com/meal"),
         status=h2r.RecipeStatus.INCOMPLETE_ESSENTIAL,
-        scraper_version=h2r.SCRAPER_VERSION,
+        scraper_version=h2r.get_scraper_version(),
     ),
     h2r.Recipe(
         ingredients=os.linesep.join(
@@ -95,7 +95,7 @@ test_recipes: list[h2r.Recipe] = [
         url=misc.URL("https://www.notcomplete.net/simple"),
         host="notcomplete.net",
         status=h2r.RecipeStatus.INCOMPLETE_ON_DISPLAY,
-        scraper_version=h2r.SCRAPER_VERSION,
+        scraper_version=h2r.get_scraper_version(),
     ),
     h2r.Recipe(
         ingredients=os.linesep.join(["Ingredient 1", "Ingredient 2", "Ingredient 3"]),
@@ -107,7 +107,7 @@ test_recipes: list[h2r.Recipe] = [
         image="notcomplete.net/basic/img.basic-png",
         url=misc.URL("https://www.notcomplete.net/basic"),
         status=h2r.RecipeStatus.COMPLETE_ON_DISPLAY,
-        scraper_version=h2r.SCRAPER_VERSION,
+        scraper_version=h2r.get_scraper_version(),
     ),
 ]
 
@@ -50,6 +50,18 @@ class Test(unittest.TestCase):
             with self.subTest(attribute=a):
                 self.assertEqual(getattr(r, a), a)
 
+    def test_info2str_instructions(self):
+        ls = os.linesep
+        params = [
+            (f"Mix{ls},Fry", f"Mix{ls}Fry"),
+            (f"Mix{ls}{ls}Fry", f"Mix{ls}Fry"),
+            (f"Mix{ls}{ls}{ls}Fry", f"Mix{ls}{ls}Fry"),
+            (f"Mix{ls}{ls},Fry", f"Mix{ls}Fry"),
+        ]
+        for instructions, validation in params:
+            with self.subTest(instructions=instructions):
+                self.assertEqual(h2r.info2str("instructions", instructions), validation)
+
     def test_int2status(self):
         recipes = [
             recipe[:-2] + (int(recipe[-2]), recipe[-1]) for recipe in test_recipes
@@ -31,6 +31,8 @@ from test.test_helpers import (
 )
 from test.test_sql import db_name, db_paths
 
+import validators
+
 from recipe2txt.utils import misc
 
 
@@ -74,6 +76,28 @@ class FileTests(unittest.TestCase):
         if diff := urls - validation:
             self.fail(f"Validation does not contain URLs that were extracted:{diff}")
 
+    def test_is_url_hosts(self):
+        params = [
+            ("https://www.example.com/recipe", True),
+            ("http://127.0.0.1/recipe", True),
+            ("http://[::1]/recipe", True),
+            ("http://[2001:db8::1]:8080/recipe", True),
+            ("http://localhost", False),
+            ("http://localhost:8000/recipe", False),
+            ("http://example", False),
+        ]
+        for url, validation in params:
+            with self.subTest(url=url):
+                self.assertEqual(misc.is_url(url), validation)
+                # The prefilter must not change what validators accepts
+                self.assertEqual(misc.is_url(url), bool(validators.url(url)))
+
+    def test_extract_urls_strip(self):
+        base = "https://www.example.com/a"
+        for suffix in ("?", "#", ";", "?q=1", "#top", ";p=1"):
+            with self.subTest(suffix=suffix):
+                self.assertEqual(misc.extract_urls([base + suffix]), {base})
+
     def test_full_path(self):
         params = [
             (
@@ -0,0 +1,109 @@
+# Copyright (C) 2023 Jan Philipp Berg <git.7ksst@aleeas.com>
+#
+# This file is part of recipe2txt.
+#
+# recipe2txt is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# recipe2txt is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# recipe2txt. If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+from shutil import rmtree
+from test.test_helpers import TEST_PROJECT_TMPDIR
+from typing import Callable, Final
+
+import recipe2txt.file_setup as fs
+import recipe2txt.parsing_error as pe
+from recipe2txt.utils.ContextLogger import disable_loggers
+from recipe2txt.utils.misc import URL
+
+copy_debug_dirs = fs.DEBUG_DIRS
+tmp_data_dir = TEST_PROJECT_TMPDIR / "test-parsing-error"
+
+disable_loggers()
+
+test_debug_dirs = fs.ProgramDirectories(
+    tmp_data_dir / "data", tmp_data_dir / "config", tmp_data_dir / "state"
+)
+
+SAME_TRACE_URLS: Final = [
+    URL("https://www.example.com/same-1"),
+    URL("https://www.example.com/same-2"),
+]
+OTHER_TRACE_URL: Final = URL("https://www.example.com/other")
+
+
+def fail_here() -> None:
+    raise ValueError("No ingredients")
+
+
+def fail_there() -> None:
+    raise ValueError("No ingredients")
+
+
+def provoke(fun: Callable[[], None]) -> Exception:
+    try:
+        fun()
+    except Exception as e:
+        return e
+    raise AssertionError(f"{fun.__name__} did not raise")
+
+
+class Test(unittest.TestCase):
+    def setUp(self) -> None:
+        fs.DEBUG_DIRS = test_debug_dirs
+        pe.categorized_errors.clear()
+        for url in SAME_TRACE_URLS:
+            pe.handle_parsing_error(url, provoke(fail_here), "ingredients")
+        pe.handle_parsing_error(OTHER_TRACE_URL, provoke(fail_there), "ingredients")
+
+    def tearDown(self) -> None:
+        fs.DEBUG_DIRS = copy_debug_dirs
+        pe.categorized_errors.clear()
+        if tmp_data_dir.is_dir():
+            rmtree(tmp_data_dir)
+
+    def test_deduplicated_report(self):
+        reports = pe.errors2str()
+        self.assertEqual(len(reports), 1)
+        title, report = reports[0]
+        self.assertEqual(
+            title, "example: ingredients - ValueError (found by recipe2txt)"
+        )
+
+        self.assertEqual(report.count("```python"), 2)
+        self.assertEqual(report.count('raise ValueError("No ingredients")'), 2)
+        stacks = report.split("```python")
+        self.assertIn(f"URL: {SAME_TRACE_URLS[0]}", stacks[0])
+        self.assertIn(f"URL: {SAME_TRACE_URLS[1]}", stacks[0])
+        self.assertIn("fail_here", stacks[1])
+        self.assertIn(f"URL: {OTHER_TRACE_URL}", stacks[1])
+        self.assertIn("fail_there", stacks[2])
+
+    def test_report_chunks(self):
+        joined = [(title, "".join(chunks)) for title, chunks in pe.iter_error_reports()]
+        self.assertEqual(joined, pe.errors2str())
+
+    def test_write_errors(self):
+        self.assertEqual(pe.write_errors(debug=True), 1)
+
+        error_dir = test_debug_dirs.state / "error_reports"
+        written = list(error_dir.glob("*/*.md"))
+        self.assertEqual(len(written), 1)
+        self.assertTrue((error_dir / fs.HOW_TO_REPORT_NAME).is_file())
+
+        title, report = pe.errors2str()[0]
+        self.assertEqual(written[0].name, title + ".md")
+        self.assertEqual(written[0].read_text(), report)
+
+    def test_write_no_errors(self):
+        pe.categorized_errors.clear()
+        self.assertEqual(pe.write_errors(debug=True), 0)
+        self.assertFalse((test_debug_dirs.state / "error_reports").exists())
@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License along with
 # recipe2txt. If not, see <https://www.gnu.org/licenses/>.
 
+import io
+import logging
 import os
 import sqlite3
 import sys
@@ -29,6 +31,7 @@ from test.test_helpers import (
 import recipe2txt.html2recipe as h2r
 import recipe2txt.sql as sql
 import recipe2txt.utils.misc as misc
+from recipe2txt.utils.ContextLogger import get_stream_handler
 
 db_name = "db_test.sqlite3"
 out_name = "out"
@@ -69,26 +72,6 @@ class TestHelpers(unittest.TestCase):
         if not delete_tmpdirs():
             print("Could not delete tmpdirs:", TMPDIRS, file=sys.stderr)
 
-    def test_fetch_again(self):
-        truth_up_to_date = [True, True, False, False, False, False, False]
-        truth_out_of_date = [True, True, True, True, True, True, False]
-        version_up_to_date = h2r.SCRAPER_VERSION
-        version_out_of_date = "-1"
-
-        self.assertEqual(len(truth_up_to_date), len(h2r.RecipeStatus))
-        self.assertEqual(len(truth_out_of_date), len(h2r.RecipeStatus))
-
-        for status, up_to_date, out_of_date in zip(
-            h2r.RecipeStatus, truth_up_to_date, truth_out_of_date
-        ):
-            with self.subTest(status=status):
-                self.assertEqual(
-                    sql.fetch_again(status, version_up_to_date), up_to_date
-                )
-                self.assertEqual(
-                    sql.fetch_again(status, version_out_of_date), out_of_date
-                )
-
     def test_sql_sanitize(self):
         params = [
             (("STRING",), '"STRING"'),
@@ -160,6 +143,9 @@ class TestDatabase(unittest.TestCase):
                 from_db = self.db.get_recipe(recipe.url)
                 self.assertEqual(recipe, from_db)
 
+    def test_iter_recipes(self):
+        self.assertEqual(list(self.db.iter_recipes()), self.db.get_recipes())
+
     def test_get_titles(self):
         titles, hosts = zip(*self.db.get_titles())
         self.assertEqual(len(titles), len(test_recipes[3:]))
@@ -188,6 +174,34 @@ class TestDatabase(unittest.TestCase):
                     ):
                         self.assertTrue(sql.fetch_again(recipe.status, "0.0"))
 
+    def test_urls_to_fetch_versions(self):
+        truth_up_to_date = [True, True, False, False, False, False, False]
+        truth_out_of_date = [True, True, True, True, True, True, False]
+        version_up_to_date = h2r.get_scraper_version()
+        version_out_of_date = "0.0"
+
+        self.assertEqual(len(truth_up_to_date), len(h2r.RecipeStatus))
+        self.assertEqual(len(truth_out_of_date), len(h2r.RecipeStatus))
+
+        expected = {}
+        for status, up_to_date, out_of_date in zip(
+            h2r.RecipeStatus, truth_up_to_date, truth_out_of_date
+        ):
+            for version, fetch in (
+                (version_up_to_date, up_to_date),
+                (version_out_of_date, out_of_date),
+            ):
+                url = f"https://www.versions.com/{status.name.lower()}/{version}"
+                self.db.new_recipe(
+                    h2r.Recipe(url=url, status=status, scraper_version=version)
+                )
+                expected[url] = fetch
+
+        to_fetch = self.db.urls_to_fetch(set(expected))
+        for url, fetch in expected.items():
+            with self.subTest(url=url):
+                self.assertEqual(url in to_fetch, fetch)
+
     def test_insert_recipe(self):
         updated = h2r.Recipe(
             title=test_recipes[2].title,
@@ -239,7 +253,7 @@ class TestDatabase(unittest.TestCase):
 
         testrecipe = h2r.Recipe(
             url="https://www.testurl.com/testrecipe",
-            scraper_version=h2r.SCRAPER_VERSION,
+            scraper_version=h2r.get_scraper_version(),
             title="Testrecipe",
             host="testurl.com",
             ingredients=os.linesep.join(["ham", "spam"]),
@@ -276,3 +290,46 @@ class TestDatabase(unittest.TestCase):
         self.db.empty_db()
         with self.assertRaises(sqlite3.OperationalError):
             self.db.get_recipes()
+
+    def test_insert_recipe_unchanged(self):
+        stored = test_recipes[3]._replace(
+            url="https://www.testurl.com/unchanged", scraper_version="0.0"
+        )
+        self.db.new_recipe(stored)
+        returned = self.db.insert_recipe(h2r.Recipe(url=stored.url))
+        self.assertEqual(self.db.get_recipe(stored.url), stored)
+        self.assertEqual(
+            returned, stored._replace(scraper_version=h2r.get_scraper_version())
+        )
+
+    def test_insert_recipe_reads(self):
+        statements: list[str] = []
+        self.db.con.set_trace_callback(statements.append)
+        self.db.insert_recipe(test_recipes[3]._replace(total_time="30"))
+        self.db.con.set_trace_callback(None)
+        self.assertFalse([s for s in statements if s.lstrip().startswith("SELECT")])
+
+    def test_insert_recipe_verbose(self):
+        handler = get_stream_handler(logging.INFO)
+        handler.setStream(io.StringIO())
+        root = logging.getLogger()
+        root.addHandler(handler)
+        # Other tests may leave the module-loggers disabled
+        disabled, sql.logger.disabled = sql.logger.disabled, False
+        statements: list[str] = []
+        try:
+            with self.assertLogs(sql.logger, logging.INFO) as logs:
+                self.db.insert_recipe(test_recipes[3]._replace(total_time="30"))
+            self.db.con.set_trace_callback(statements.append)
+            unchanged = self.db.insert_recipe(test_recipes[3])
+            self.db.con.set_trace_callback(None)
+        finally:
+            sql.logger.disabled = disabled
+            root.removeHandler(handler)
+
+        self.assertEqual(
+            logs.output, [f"INFO:{sql.logger.name}:total_time: {h2r.NA} => 30"]
+        )
+        self.assertEqual(unchanged, self.db.get_recipe(test_recipes[3].url))
+        selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+        self.assertEqual(len(selects), 1)
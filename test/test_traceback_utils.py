@@ -15,8 +15,9 @@
 # recipe2txt. If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import traceback
 import unittest
-from test.testfiles.permanent.gen_stack import GenTraces
+from test.testfiles.permanent.gen_stack import GenTraces, fun5
 
 import recipe2txt.utils.traceback_utils as tb_u
 
@@ -41,6 +42,19 @@ class TracebackTests(unittest.TestCase):
                 ):
                     self.assertEqual(frame.filename, ".../gen_stack.py")
 
+    def test_shorten_paths_deferred_lines(self):
+        try:
+            fun5(-1)
+        except ValueError as e:
+            tb_ex = traceback.TracebackException.from_exception(e, lookup_lines=False)
+        else:
+            self.fail("fun5 did not raise")
+
+        formatted = "".join(tb_u.shorten_paths(tb_ex.stack, "test").format())
+        path = os.path.join("...", "test", "testfiles", "permanent", "gen_stack.py")
+        self.assertIn(path, formatted)
+        self.assertIn("return sqrt(x)", formatted)
+
     def test_get_shared_frames(self):
         shared = tb_u.get_shared_frames(self.gen_tbs.tb_ex_list)
 
@@ -127,7 +127,11 @@ def parse_html(filename: File, filename_parsed: File, url: URL) -> h2r.Recipe:
                 logger.error("%s not found", method)
             a = h2r.info2str(method, a)
             attributes.append(a)
-        attributes += [url, str(int(h2r.gen_status(attributes))), h2r.SCRAPER_VERSION]
+        attributes += [
+            url,
+            str(int(h2r.gen_status(attributes))),
+            h2r.get_scraper_version(),
+        ]
         recipe = h2r.Recipe(*attributes)  # type: ignore[arg-type]
     with filename_parsed.open("w") as file:
         for a in attributes: